@@ -14,9 +14,11 @@ def randbool(n, rng=None):
     ----------
     n: int
         Number of samples
-    rng: np.random.RandomState
+    rng: np.random.RandomState or np.random.Generator
         Random number generator. If not provided, use numpy's default.
     """
     if rng is None:
         rng = np.random
-    return rng.randint(2, size=n) * 2 - 1
+    # `Generator` (e.g. from `np.random.default_rng`) names it `integers`.
+    randint = getattr(rng, 'integers', None) or rng.randint
+    return randint(2, size=n) * 2 - 1